@@ -1,11 +1,29 @@
 import os
 import sys
-import shutil
 import re
+import copy
 from docx import Document
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
 from docx2pdf import convert
 
+# Splits text into alternating non-digit / digit segments
+DIGIT_RE = re.compile(r'(\d+)')
+# Fast check for whether a paragraph contains any digit at all
+HAS_DIGIT = re.compile(r'\d').search
+
+def _has_uniform_formatting(runs):
+    """Check whether all runs share the same run properties (<w:rPr>)"""
+    def rpr_xml(run):
+        rpr = run._r.rPr
+        return rpr.xml if rpr is not None else None
+    
+    first = rpr_xml(runs[0])
+    return all(rpr_xml(run) == first for run in runs[1:])
+
+def _has_only_runs(paragraph):
+    """Check whether a paragraph holds nothing but runs (no hyperlinks, bookmarks, proofing marks...)"""
+    return not paragraph._p.xpath('./*[not(self::w:pPr or self::w:r)]')
+
 def center_docx_text(source_path, target_path=None):
     """
     Create a copy of a DOCX file and center all text in the new file.
@@ -39,15 +57,13 @@ def center_docx_text(source_path, target_path=None):
             name, ext = os.path.splitext(file_name)
             target_path = os.path.join(new_folder, f"{name}_new{ext}")
         
-        # Create a copy of the original file
-        shutil.copy2(source_path, target_path)
-        
-        # Open the copied document
-        doc = Document(target_path)
+        # Open the original document; the edited copy is written to target_path on save
+        doc = Document(source_path)
         
         # Process all paragraphs in the document
         for paragraph in doc.paragraphs:
-            if paragraph.text.strip():  # Only process non-empty paragraphs
+            para_text = paragraph.text
+            if para_text.strip():  # Only process non-empty paragraphs
                 # Center the paragraph and set right-to-left text direction
                 paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
                 paragraph.paragraph_format.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
@@ -56,75 +72,54 @@ def center_docx_text(source_path, target_path=None):
                 # Note: We can't use paragraph.paragraph_format.bidi as it's not available in python-docx
                 # Instead, we'll rely on setting RTL at the run level
                 
-                # Set RTL for all existing runs
-                for run in paragraph.runs:
-                    run.font.rtl = True
+                runs = paragraph.runs
+                has_digit = HAS_DIGIT(para_text)
                 
-                # We'll process each run separately to preserve formatting
-                if any(char.isdigit() for char in paragraph.text):
-                    # Store the original runs with their formatting
-                    original_runs = []
-                    for run in paragraph.runs:
-                        original_runs.append({
-                            'text': run.text,
-                            'bold': run.bold,
-                            'italic': run.italic,
-                            'underline': run.underline,
-                            'color': run.font.color.rgb if run.font.color else None,
-                            'size': run.font.size,
-                            'name': run.font.name
-                        })
-                    
-                    # Clear the paragraph to rebuild it
-                    paragraph.clear()
-                    
-                    # Process each original run
-                    for run_data in original_runs:
-                        text = run_data['text']
-                        i = 0
+                if has_digit:
+                    if runs and _has_uniform_formatting(runs) and _has_only_runs(paragraph):
+                        # Every run looks the same, so the paragraph can become a single run
+                        # with the numbers wrapped in place; no rebuild is needed
+                        first_run = runs[0]
+                        first_run.text = DIGIT_RE.sub(r"﴿\1﴾", "".join(run.text for run in runs))
+                        for run in runs[1:]:
+                            run._r.getparent().remove(run._r)
+                        first_run.font.rtl = True
+                    elif runs and _has_uniform_formatting(runs):
+                        # Other content sits between the runs, so merging them would move
+                        # text around it; wrap the numbers inside each run instead
+                        for run in runs:
+                            run.text = DIGIT_RE.sub(r"﴿\1﴾", run.text)
+                            run.font.rtl = True
+                    else:
+                        # We'll process each run separately to preserve formatting
+                        # Store the original runs as (text, run properties) pairs; the
+                        # <w:rPr> element carries all of the run's formatting at once
+                        original_runs = [(run.text, run._r.rPr) for run in runs]
+                        
+                        # Clear the paragraph to rebuild it
+                        paragraph.clear()
+                        
+                        def _apply(new_run, rpr):
+                            """Apply the original run formatting to a rebuilt run"""
+                            if rpr is not None:
+                                new_run._r.insert(0, copy.deepcopy(rpr))
+                            # Set RTL for the new run
+                            new_run.font.rtl = True
                         
-                        while i < len(text):
-                            # Check if the current character is an Arabic numeral
-                            if text[i].isdigit():
-                                # Collect the full number
-                                num_start = i
-                                while i < len(text) and text[i].isdigit():
-                                    i += 1
-                                number = text[num_start:i]
-                                
-                                # Add ornate parentheses around the number (U+FD3E & U+FD3F)
-                                new_run = paragraph.add_run(f"﴿{number}﴾")
-                                
-                                # Apply original formatting to the new run
-                                new_run.bold = run_data['bold']
-                                new_run.italic = run_data['italic']
-                                new_run.underline = run_data['underline']
-                                if run_data['color']:
-                                    new_run.font.color.rgb = run_data['color']
-                                if run_data['size']:
-                                    new_run.font.size = run_data['size']
-                                if run_data['name']:
-                                    new_run.font.name = run_data['name']
-                                # Set RTL for the new run
-                                new_run.font.rtl = True
-                            else:
-                                # Add the character as is with original formatting
-                                new_run = paragraph.add_run(text[i])
-                                
-                                # Apply original formatting to the new run
-                                new_run.bold = run_data['bold']
-                                new_run.italic = run_data['italic']
-                                new_run.underline = run_data['underline']
-                                if run_data['color']:
-                                    new_run.font.color.rgb = run_data['color']
-                                if run_data['size']:
-                                    new_run.font.size = run_data['size']
-                                if run_data['name']:
-                                    new_run.font.name = run_data['name']
-                                # Set RTL for the new run
-                                new_run.font.rtl = True
-                                
-                                i += 1
+                        # Process each original run, emitting one run per text or number segment
+                        for text, rpr in original_runs:
+                            # Odd indices of the split are the captured digit groups
+                            for index, part in enumerate(DIGIT_RE.split(text)):
+                                if not part:
+                                    continue
+                                if index % 2:
+                                    # Add ornate parentheses around the number (U+FD3E & U+FD3F)
+                                    part = f"﴿{part}﴾"
+                                _apply(paragraph.add_run(part), rpr)
+                else:
+                    # Set RTL for all existing runs
+                    for run in runs:
+                        run.font.rtl = True
         
         # Save the modified document
         doc.save(target_path)
@@ -1,6 +1,7 @@
 import os
+import re
 import tempfile
-import docx
+import functools
 from reportlab.lib.pagesizes import A4
 from reportlab.pdfgen import canvas
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -10,8 +11,9 @@ from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_RIGHT
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
-import arabic_reshaper
 from bidi.algorithm import get_display
+from frame import RESHAPER, draw_quran_frame
+from docx_utils import list_docx_files, stream_paragraph_texts
 
 # Create a fonts directory if it doesn't exist
 font_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fonts")
@@ -42,69 +44,45 @@ except Exception as e:
         print("Using Arial font for text...")
 
 
-def is_arabic_numeral(char):
-    """Check if a character is an Arabic numeral (0-9)"""
-    return char.isdigit()
+# Matches a full ayah number within a line of text
+_AYAH_NUMBER_RE = re.compile(r'\d+')
 
-def extract_text_from_docx(docx_path):
-    """Extract text from a .docx file"""
-    doc = docx.Document(docx_path)
+def _wrap_ayah_number(match):
+    """Wrap an ayah number in the ornate parentheses used in Quranic text (U+FD3E & U+FD3F)"""
+    return f" ﴿{match.group(0)}﴾ "
+
+def shape_line(line):
+    """Prepare a line of Quranic text for display in the PDF"""
+    # Add decorative elements around ayah numbers
+    processed_line = _AYAH_NUMBER_RE.sub(_wrap_ayah_number, line)
+    
+    # Reshape Arabic text for proper display
+    reshaped_text = RESHAPER.reshape(processed_line)
+    return get_display(reshaped_text)
+
+@functools.lru_cache(maxsize=None)
+def _load_text(docx_path, mtime):
+    """Parse a .docx file once per modification time and cache its lines"""
     text = []
     
-    for para in doc.paragraphs:
-        if para.text.strip():
-            text.append(para.text.strip())
+    for para_text in stream_paragraph_texts(docx_path):
+        stripped = para_text.strip()
+        if stripped:
+            text.append(stripped)
     
-    return text
+    return tuple(text)
+
+def extract_text_from_docx(docx_path, mtime=None):
+    """Extract text from a .docx file"""
+    if mtime is None:
+        mtime = os.path.getmtime(docx_path)
+    return list(_load_text(docx_path, mtime))
 
 # Function to draw decorative frame on each page
-def draw_quran_frame(canvas, doc):
-    """Draw a decorative frame on each page to make it look like a Quran"""
-    width, height = A4
-    
-    # Fill background with a light cream color for parchment effect
-    canvas.setFillColorRGB(1.0, 0.98, 0.94)  # Very light cream
-    canvas.rect(0, 0, width, height, fill=1, stroke=0)
-    
-    # Set the frame color to a gold/brown tone
-    canvas.setStrokeColorRGB(0.6, 0.4, 0.2)  # Brown/gold color
-    canvas.setLineWidth(2)
-    
-    # Draw outer frame with rounded corners
-    canvas.roundRect(1*cm, 1*cm, width-2*cm, height-2*cm, radius=10, stroke=1, fill=0)
-    
-    # Draw inner frame
-    canvas.roundRect(1.5*cm, 1.5*cm, width-3*cm, height-3*cm, radius=8, stroke=1, fill=0)
-    
-    # Draw decorative corners
-    corner_size = 0.8*cm
-    # Top left
-    canvas.line(1*cm, 2*cm, 1*cm+corner_size, 2*cm)
-    canvas.line(2*cm, 1*cm, 2*cm, 1*cm+corner_size)
-    # Top right
-    canvas.line(width-1*cm, 2*cm, width-1*cm-corner_size, 2*cm)
-    canvas.line(width-2*cm, 1*cm, width-2*cm, 1*cm+corner_size)
-    # Bottom left
-    canvas.line(1*cm, height-2*cm, 1*cm+corner_size, height-2*cm)
-    canvas.line(2*cm, height-1*cm, 2*cm, height-1*cm-corner_size)
-    # Bottom right
-    canvas.line(width-1*cm, height-2*cm, width-1*cm-corner_size, height-2*cm)
-    canvas.line(width-2*cm, height-1*cm, width-2*cm, height-1*cm-corner_size)
-    
-    # Draw decorative divider at the top
-    canvas.setStrokeColorRGB(0.6, 0.4, 0.2)
-    canvas.setLineWidth(1)
-    canvas.line(width/2 - 4*cm, height-2.5*cm, width/2 + 4*cm, height-2.5*cm)
-    
-    # Add Bismillah text at the top of each page
-    bismillah = "بِسْمِ اللَّهِ الرَّحْمَنِ الرَّحِيمِ"
-    reshaped_bismillah = arabic_reshaper.reshape(bismillah)
-    bidi_bismillah = get_display(reshaped_bismillah)
-    
-    canvas.setFont(arabic_font, 14)
-    canvas.setFillColorRGB(0.6, 0.4, 0.2)  # Brown/gold color
-    canvas.drawCentredString(width/2, height-2.8*cm, bidi_bismillah)
-    
+def draw_page_frame(canvas, doc):
+    """Draw the decorative Quran frame on each page of the document"""
+    width, height = doc.pagesize
+    draw_quran_frame(canvas, width, height, arabic_font)
 
 def create_quran_pdf(pages_folder, output_pdf):
     """
@@ -112,8 +90,7 @@ def create_quran_pdf(pages_folder, output_pdf):
     Format the text to look like a Quran with centered text and continuous lines.
     """
     # Get all .docx files
-    docx_files = [f for f in os.listdir(pages_folder) if f.endswith('.docx')]
-    docx_files.sort()  # Sort files to maintain order
+    docx_files = list_docx_files(pages_folder)
     
     if not docx_files:
         print("No .docx files found in the pages folder.")
@@ -133,7 +110,7 @@ def create_quran_pdf(pages_folder, output_pdf):
     frame = Frame(doc.leftMargin, doc.bottomMargin, 
                  doc.width, doc.height, 
                  id='normal')
-    template = PageTemplate(id='quran_template', frames=frame, onPage=draw_quran_frame)
+    template = PageTemplate(id='quran_template', frames=frame, onPage=draw_page_frame)
     doc.addPageTemplates([template])
     
     # Create a centered style for Arabic text
@@ -167,11 +144,10 @@ def create_quran_pdf(pages_folder, output_pdf):
     
     # Process each docx file
     for i, docx_file in enumerate(docx_files):
-        docx_path = os.path.join(pages_folder, docx_file)
-        print(f"Processing {docx_file}...")
+        print(f"Processing {docx_file.name}...")
         
-        # Extract text from the docx file
-        text_lines = extract_text_from_docx(docx_path)
+        # Extract text from the docx file, reusing the stat from the directory scan
+        text_lines = extract_text_from_docx(docx_file.path, docx_file.stat().st_mtime)
         
         # Add a page break if not the first file
         if i > 0:
@@ -179,32 +155,8 @@ def create_quran_pdf(pages_folder, output_pdf):
         
         elements.append(Spacer(1, 20))
         
-        # Process each line of text
-        for line in text_lines:
-            # Process the line to add decorative elements around ayah numbers
-            processed_line = ""
-            i = 0
-            while i < len(line):
-                if is_arabic_numeral(line[i]):
-                    # Collect the full number
-                    num_start = i
-                    while i < len(line) and is_arabic_numeral(line[i]):
-                        i += 1
-                    number = line[num_start:i]
-                    
-                    # Add decorative element around the number in traditional Quran style
-                    # Using Unicode ornate parentheses specifically designed for Quranic text
-                    processed_line += f" ﴿{number}﴾ "
-                else:
-                    processed_line += line[i]
-                    i += 1
-            
-            # Reshape Arabic text for proper display
-                reshaped_text = arabic_reshaper.reshape(processed_line)
-                bidi_text = get_display(reshaped_text)
-            
-            # Add the line to the PDF
-            elements.append(Paragraph(bidi_text, quran_style))
+        # Process each line of text and add it to the PDF
+        elements.extend(Paragraph(shape_line(line), quran_style) for line in text_lines)
     
     # Build the PDF
     doc.build(elements)
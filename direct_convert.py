@@ -1,89 +1,76 @@
+import io
 import os
+import functools
+import time
 import tempfile
 import shutil
+import threading
 from docx2pdf import convert
-from PyPDF2 import PdfMerger, PdfReader, PdfWriter
+from PyPDF2 import PdfReader, PdfWriter, PageObject
 from reportlab.lib.pagesizes import A4
 from reportlab.pdfgen import canvas
-from reportlab.lib.units import cm
+from frame import draw_quran_frame
+from docx_utils import list_docx_files
 
-def draw_quran_frame(canvas, width, height):
-    """Draw a decorative frame on a page to make it look like a Quran"""
-    # Fill background with a light cream color for parchment effect
-    canvas.setFillColorRGB(1.0, 0.98, 0.94)  # Very light cream
-    canvas.rect(0, 0, width, height, fill=1, stroke=0)
-    
-    # Set the frame color to a gold/brown tone
-    canvas.setStrokeColorRGB(0.6, 0.4, 0.2)  # Brown/gold color
-    canvas.setLineWidth(2)
-    
-    # Draw outer frame with rounded corners
-    canvas.roundRect(1*cm, 1*cm, width-2*cm, height-2*cm, radius=10, stroke=1, fill=0)
-    
-    # Draw inner frame
-    canvas.roundRect(1.5*cm, 1.5*cm, width-3*cm, height-3*cm, radius=8, stroke=1, fill=0)
-    
-    # Draw decorative corners
-    corner_size = 0.8*cm
-    # Top left
-    canvas.line(1*cm, 2*cm, 1*cm+corner_size, 2*cm)
-    canvas.line(2*cm, 1*cm, 2*cm, 1*cm+corner_size)
-    # Top right
-    canvas.line(width-1*cm, 2*cm, width-1*cm-corner_size, 2*cm)
-    canvas.line(width-2*cm, 1*cm, width-2*cm, 1*cm+corner_size)
-    # Bottom left
-    canvas.line(1*cm, height-2*cm, 1*cm+corner_size, height-2*cm)
-    canvas.line(2*cm, height-1*cm, 2*cm, height-1*cm-corner_size)
-    # Bottom right
-    canvas.line(width-1*cm, height-2*cm, width-1*cm-corner_size, height-2*cm)
-    canvas.line(width-2*cm, height-1*cm, width-2*cm, height-1*cm-corner_size)
-    
-    # Draw decorative divider at the top
-    canvas.setStrokeColorRGB(0.6, 0.4, 0.2)
-    canvas.setLineWidth(1)
-    canvas.line(width/2 - 4*cm, height-2.5*cm, width/2 + 4*cm, height-2.5*cm)
-    
-    # Add Bismillah text at the top of each page
-    canvas.setFillColorRGB(0.6, 0.4, 0.2)  # Brown/gold color
-    canvas.setFont("Helvetica", 14)
-    # We'll use the Unicode directly for Bismillah
-    bismillah = "بِسْمِ اللَّهِ الرَّحْمَنِ الرَّحِيمِ"
-    canvas.drawCentredString(width/2, height-2.8*cm, bismillah)
+def _wait_for_pdfs(pdf_paths, conversion_done, conversion_failed, poll_interval=0.2):
+    """
+    Yield each expected PDF path as soon as docx2pdf has finished writing it.
+    docx2pdf converts the files one after another, so a PDF is complete once the
+    next one appears or the whole conversion has finished.
+    """
+    for index, pdf_path in enumerate(pdf_paths):
+        next_path = pdf_paths[index + 1] if index + 1 < len(pdf_paths) else None
+        while not conversion_done.is_set() and not (next_path and os.path.exists(next_path)):
+            time.sleep(poll_interval)
+        
+        if conversion_failed.is_set():
+            raise RuntimeError("DOCX to PDF conversion failed")
+        
+        # A page docx2pdf could not convert must fail the run, not silently go missing
+        if not os.path.exists(pdf_path):
+            raise FileNotFoundError(f"Converted PDF not found: {pdf_path}")
+        yield pdf_path
+
+@functools.lru_cache(maxsize=None)
+def _frame_pdf_bytes(width, height):
+    """Render the decorative frame once per page size into an in-memory one-page PDF"""
+    frame_buffer = io.BytesIO()
+    c = canvas.Canvas(frame_buffer, pagesize=(width, height))
+    draw_quran_frame(c, width, height)
+    c.save()
+    return frame_buffer.getvalue()
 
-def create_decorated_pdf(input_pdf_path, output_pdf_path):
-    """Add decorative frame to each page of the PDF"""
-    # Read the input PDF
-    reader = PdfReader(input_pdf_path)
+def create_decorated_pdf(input_pdf_paths, output_pdf_path):
+    """Add decorative frame to each page of the PDFs and write them as a single PDF"""
     writer = PdfWriter()
     
-    # Process each page
-    for page_num in range(len(reader.pages)):
-        # Get the page
-        page = reader.pages[page_num]
-        
-        # Create a new PDF with just the decorative frame
-        temp_frame_path = os.path.join(tempfile.gettempdir(), f"frame_{page_num}.pdf")
-        c = canvas.Canvas(temp_frame_path, pagesize=A4)
-        width, height = A4
-        
-        # Draw the decorative frame
-        draw_quran_frame(c, width, height)
-        c.save()
-        
-        # Create a new PDF with the frame
-        frame_reader = PdfReader(temp_frame_path)
-        frame_page = frame_reader.pages[0]
-        
-        # Merge the original content with the frame
-        frame_page.merge_page(page)
-        writer.add_page(frame_page)
-        
-        # Clean up the temporary file
-        os.remove(temp_frame_path)
+    # The frame is identical on every page, so parse the shared frame PDF once
+    width, height = A4
+    frame_template = PdfReader(io.BytesIO(_frame_pdf_bytes(width, height))).pages[0]
     
-    # Save the output PDF
-    with open(output_pdf_path, "wb") as output_file:
-        writer.write(output_file)
+    # Process each page of each input PDF, in order
+    for input_pdf_path in input_pdf_paths:
+        reader = PdfReader(input_pdf_path)
+        for page in reader.pages:
+            # Stamp the shared frame onto a blank page, merging never mutates the template
+            frame_page = PageObject.create_blank_page(width=width, height=height)
+            frame_page.merge_page(frame_template)
+            
+            # Merge the original content with the frame
+            frame_page.merge_page(page)
+            writer.add_page(frame_page)
+    
+    # Save the output PDF to a temporary file first and move it into place, so a
+    # failed run never replaces a previous good output
+    temp_path = output_pdf_path + ".tmp"
+    try:
+        with open(temp_path, "wb") as output_file:
+            writer.write(output_file)
+        os.replace(temp_path, output_pdf_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
     
     return output_pdf_path
 
@@ -94,8 +81,7 @@ def create_quran_pdf(pages_folder, output_pdf):
     Then add decorative frames to make it look like a Quran.
     """
     # Get all .docx files
-    docx_files = [f for f in os.listdir(pages_folder) if f.endswith('.docx')]
-    docx_files.sort()  # Sort files to maintain order
+    docx_files = list_docx_files(pages_folder)
     
     if not docx_files:
         print("No .docx files found in the pages folder.")
@@ -103,33 +89,51 @@ def create_quran_pdf(pages_folder, output_pdf):
     
     # Create temporary folder for individual PDFs
     temp_dir = tempfile.mkdtemp()
-    pdf_paths = []
     
     try:
-        # Convert each .docx to PDF directly to preserve all formatting and harakat
-        for docx_file in docx_files:
-            docx_path = os.path.join(pages_folder, docx_file)
-            pdf_path = os.path.join(temp_dir, f"{os.path.splitext(docx_file)[0]}.pdf")
-            
-            print(f"Converting {docx_file} to PDF...")
-            convert(docx_path, pdf_path)
-            pdf_paths.append(pdf_path)
+        # Stage the .docx files in their own folder so docx2pdf can convert them all
+        # in a single Word session. The zero-padded prefix keeps the sorted order of
+        # the generated PDFs identical to the original .docx order.
+        input_dir = os.path.join(temp_dir, "in")
+        os.makedirs(input_dir)
+        for index, docx_file in enumerate(docx_files):
+            shutil.copy(docx_file.path, os.path.join(input_dir, f"{index:05d}_{docx_file.name}"))
+        
+        pdf_paths = [os.path.join(temp_dir, f"{index:05d}_{os.path.splitext(docx_file.name)[0]}.pdf")
+                     for index, docx_file in enumerate(docx_files)]
+        
+        # Add decorative frames on a background thread while Word is still converting,
+        # combining the PDFs directly so no intermediate merged document is needed
+        conversion_done = threading.Event()
+        conversion_failed = threading.Event()
+        stamp_errors = []
         
-        # Merge all PDFs into one
-        merged_pdf_path = os.path.join(temp_dir, "merged.pdf")
-        merger = PdfMerger()
+        def stamp_frames():
+            try:
+                create_decorated_pdf(_wait_for_pdfs(pdf_paths, conversion_done, conversion_failed), output_pdf)
+            except Exception as e:
+                stamp_errors.append(e)
         
-        for pdf_path in pdf_paths:
-            merger.append(pdf_path)
+        stamper = threading.Thread(target=stamp_frames)
+        stamper.start()
         
-        # Write to the merged file
-        print(f"Merging PDFs...")
-        merger.write(merged_pdf_path)
-        merger.close()
+        # Convert every .docx to PDF directly to preserve all formatting and harakat.
+        # This runs on the main thread, where Word automation is already set up.
+        print(f"Converting {len(docx_files)} .docx files to PDF and adding decorative Quran frames...")
+        converted = False
+        try:
+            convert(input_dir, temp_dir)
+            converted = True
+        finally:
+            # Any way out other than a normal return (including KeyboardInterrupt or
+            # SystemExit) must stop the stamper before it writes the output
+            if not converted:
+                conversion_failed.set()
+            conversion_done.set()
+            stamper.join()
         
-        # Add decorative frames to the merged PDF
-        print("Adding decorative Quran frames...")
-        create_decorated_pdf(merged_pdf_path, output_pdf)
+        if stamp_errors:
+            raise stamp_errors[0]
         
         print(f"PDF created successfully: {output_pdf}")
         return output_pdf
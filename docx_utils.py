@@ -0,0 +1,92 @@
+import os
+import zipfile
+from lxml import etree
+
+# WordprocessingML namespace used by document.xml
+_W_NS = {'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'}
+# Text-bearing content of a paragraph's runs, including runs inside hyperlinks.
+# These are the same run children python-docx reads for Run.text.
+_T_XPATH = etree.XPath(
+    '(./w:r | ./w:hyperlink/w:r)/*[self::w:br or self::w:cr or self::w:noBreakHyphen'
+    ' or self::w:ptab or self::w:t or self::w:tab]',
+    namespaces=_W_NS)
+# Plain-text equivalents of the empty run content elements, as rendered by python-docx
+_CONTENT_TEXT = {
+    '{%s}cr' % _W_NS['w']: '\n',
+    '{%s}noBreakHyphen' % _W_NS['w']: '-',
+    '{%s}ptab' % _W_NS['w']: '\t',
+    '{%s}tab' % _W_NS['w']: '\t',
+}
+_T_TAG = '{%s}t' % _W_NS['w']
+_BR_TAG = '{%s}br' % _W_NS['w']
+_BR_TYPE = '{%s}type' % _W_NS['w']
+_P_TAG = '{%s}p' % _W_NS['w']
+_BODY_TAG = '{%s}body' % _W_NS['w']
+
+# Package relationships, used to find the main document part the way python-docx does
+_PKG_RELS_PART = '_rels/.rels'
+_RELS_NS = {'r': 'http://schemas.openxmlformats.org/package/2006/relationships'}
+_OFFICE_DOCUMENT_REL = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument'
+_MAIN_PART_XPATH = etree.XPath('./r:Relationship[@Type=$rel_type]/@Target', namespaces=_RELS_NS)
+
+def _content_text(elem):
+    """Return the text of a single run content element, matching python-docx"""
+    if elem.tag == _T_TAG:
+        return elem.text or ''
+    if elem.tag == _BR_TAG:
+        # Line breaks are newlines; page and column breaks carry no text
+        return '\n' if elem.get(_BR_TYPE, 'textWrapping') == 'textWrapping' else ''
+    return _CONTENT_TEXT.get(elem.tag, '')
+
+def _paragraph_text(p):
+    """Join the text of a w:p element's runs, as python-docx's Paragraph.text does"""
+    return ''.join(_content_text(e) for e in _T_XPATH(p))
+
+def _page_sort_key(entry):
+    """Sort numbered pages numerically (602 before 1002), then any other files by name"""
+    stem = os.path.splitext(entry.name)[0]
+    if stem.isdecimal():
+        return (0, int(stem), entry.name)
+    return (1, 0, entry.name)
+
+def list_docx_files(folder):
+    """
+    Return the .docx files in a folder as os.DirEntry objects, in page order.
+    The entries cache their stat results, so callers can read sizes or
+    modification times without another system call.
+    """
+    with os.scandir(folder) as it:
+        entries = [e for e in it if e.is_file() and e.name.endswith('.docx')]
+    entries.sort(key=_page_sort_key)
+    return entries
+
+def _main_part_name(z):
+    """Return the ZIP member name of the main document part, read from the package relationships"""
+    with z.open(_PKG_RELS_PART) as f:
+        targets = _MAIN_PART_XPATH(etree.parse(f).getroot(), rel_type=_OFFICE_DOCUMENT_REL)
+    if not targets:
+        raise KeyError(f"No main document part in {_PKG_RELS_PART}")
+    # Targets are relative to the package root; ZIP member names carry no leading slash
+    return targets[0].lstrip('/')
+
+def stream_paragraph_texts(docx_path):
+    """
+    Yield the text of each top-level paragraph of a .docx file without python-docx.
+    Only the main document part (usually word/document.xml, located through
+    _rels/.rels as python-docx does) is parsed, incrementally, and finished
+    paragraphs are discarded as it goes, so styles, numbering and other parts
+    are never loaded.
+    Use this for read-only access; python-docx is still needed to edit a document.
+    """
+    with zipfile.ZipFile(docx_path) as z, z.open(_main_part_name(z)) as f:
+        for _, elem in etree.iterparse(f, tag=_P_TAG):
+            parent = elem.getparent()
+            # Paragraphs nested in tables or text boxes are handled with their container
+            if parent.tag != _BODY_TAG:
+                continue
+            yield _paragraph_text(elem)
+            
+            # Free the finished paragraph and anything before it
+            elem.clear()
+            while elem.getprevious() is not None:
+                del parent[0]
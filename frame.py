@@ -0,0 +1,63 @@
+from reportlab.lib.units import cm
+from arabic_reshaper import ArabicReshaper
+from bidi.algorithm import get_display
+
+# Name of the form XObject the frame is recorded into on each canvas
+FRAME_FORM = 'quranframe'
+
+# Shared reshaper for all Quranic text; built once and configured to keep the harakat
+RESHAPER = ArabicReshaper(configuration={'delete_harakat': False})
+
+# The Bismillah never changes, so reshape it and apply BiDi ordering once at import
+BISMILLAH_BIDI = get_display(RESHAPER.reshape("بِسْمِ اللَّهِ الرَّحْمَنِ الرَّحِيمِ"))
+
+def draw_quran_frame(canvas, width, height, font_name="Helvetica"):
+    """Draw a decorative frame on a page to make it look like a Quran"""
+    # The frame is the same on every page, so record it once as a form XObject
+    # and reuse it on the following pages
+    if not canvas.hasForm(FRAME_FORM):
+        canvas.beginForm(FRAME_FORM)
+        _draw_frame_contents(canvas, width, height, font_name)
+        canvas.endForm()
+    canvas.doForm(FRAME_FORM)
+
+def _draw_frame_contents(canvas, width, height, font_name):
+    """Issue the drawing operations for the decorative frame"""
+    # Fill background with a light cream color for parchment effect
+    canvas.setFillColorRGB(1.0, 0.98, 0.94)  # Very light cream
+    canvas.rect(0, 0, width, height, fill=1, stroke=0)
+    
+    # Set the frame color to a gold/brown tone
+    canvas.setStrokeColorRGB(0.6, 0.4, 0.2)  # Brown/gold color
+    canvas.setLineWidth(2)
+    
+    # Draw outer frame with rounded corners
+    canvas.roundRect(1*cm, 1*cm, width-2*cm, height-2*cm, radius=10, stroke=1, fill=0)
+    
+    # Draw inner frame
+    canvas.roundRect(1.5*cm, 1.5*cm, width-3*cm, height-3*cm, radius=8, stroke=1, fill=0)
+    
+    # Draw decorative corners
+    corner_size = 0.8*cm
+    # Top left
+    canvas.line(1*cm, 2*cm, 1*cm+corner_size, 2*cm)
+    canvas.line(2*cm, 1*cm, 2*cm, 1*cm+corner_size)
+    # Top right
+    canvas.line(width-1*cm, 2*cm, width-1*cm-corner_size, 2*cm)
+    canvas.line(width-2*cm, 1*cm, width-2*cm, 1*cm+corner_size)
+    # Bottom left
+    canvas.line(1*cm, height-2*cm, 1*cm+corner_size, height-2*cm)
+    canvas.line(2*cm, height-1*cm, 2*cm, height-1*cm-corner_size)
+    # Bottom right
+    canvas.line(width-1*cm, height-2*cm, width-1*cm-corner_size, height-2*cm)
+    canvas.line(width-2*cm, height-1*cm, width-2*cm, height-1*cm-corner_size)
+    
+    # Draw decorative divider at the top
+    canvas.setStrokeColorRGB(0.6, 0.4, 0.2)
+    canvas.setLineWidth(1)
+    canvas.line(width/2 - 4*cm, height-2.5*cm, width/2 + 4*cm, height-2.5*cm)
+    
+    # Add Bismillah text at the top of each page
+    canvas.setFont(font_name, 14)
+    canvas.setFillColorRGB(0.6, 0.4, 0.2)  # Brown/gold color
+    canvas.drawCentredString(width/2, height-2.8*cm, BISMILLAH_BIDI)
@@ -1,6 +1,7 @@
 import os
 import docx
 import sys
+from docx_utils import stream_paragraph_texts
 
 def get_docx_content(docx_path):
     """
@@ -8,14 +9,11 @@ def get_docx_content(docx_path):
     Returns a string containing all the text from the document.
     """
     try:
-        # Open the DOCX file
-        doc = docx.Document(docx_path)
-        
-        # Collect all text from paragraphs
+        # Collect all text from paragraphs, streaming them from the DOCX file
         full_text = []
-        for para in doc.paragraphs:
-            if para.text.strip():
-                full_text.append(para.text)
+        for para_text in stream_paragraph_texts(docx_path):
+            if para_text.strip():
+                full_text.append(para_text)
         
         # Join all paragraphs with newlines
         return "\n".join(full_text)